@@ -0,0 +1,114 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+import httpx
+import supabase
+from postgrest import SyncPostgrestClient
+from supabase.lib.auth_client import SupabaseAuthClient
+from supabase.lib.storage_client import SupabaseStorageClient
+
+# Load environment variables from backend/.env. An explicit path instead of
+# find_dotenv(), which walks up the directory tree looking for one.
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+
+# Fail at import with a clear message rather than on the first request
+def _require_env(name):
+    value = os.getenv(name)
+    if not value:
+        raise RuntimeError(f"{name} is not set; add it to the environment or backend/.env")
+    return value
+
+supabase_url = _require_env("SUPABASE_URL").rstrip("/")  # No trailing slash
+supabase_key = _require_env("SUPABASE_KEY")
+
+# Public URL of an object in a public Storage bucket. Same format as
+# storage.from_(bucket).get_public_url(path), built without the client.
+def public_storage_url(bucket, path):
+    return f"{supabase_url}/storage/v1/object/public/{bucket}/{path}"
+
+# Secret Supabase signs user access tokens with (Settings -> API -> JWT Secret).
+# When set, tokens are verified locally instead of via the Auth API.
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+
+# All Supabase sub-clients (auth, postgrest, storage) talk to the same host, so
+# they share one HTTP/2 transport and therefore one keep-alive pool per process.
+#
+# These are HTTPS connections to the Supabase API gateway, not Postgres
+# connections; PostgREST keeps its own database pool behind the gateway. A
+# request thread holds at most one at a time, so keep SUPABASE_MAX_CONNECTIONS
+# at or above GUNICORN_THREADS (8 by default) or threads queue for a socket.
+# Total sockets opened against the project are workers * MAX_CONNECTIONS,
+# e.g. 17 workers (2 * CPU + 1 on 8 cores) * 10 = 170; lower WEB_CONCURRENCY
+# if the network path in front of the app limits outbound connections.
+MAX_CONNECTIONS = int(os.getenv("SUPABASE_MAX_CONNECTIONS", 10))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SUPABASE_MAX_KEEPALIVE_CONNECTIONS", 5))
+
+def _new_transport():
+    return httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            # Idle sockets are dropped after this many seconds
+            keepalive_expiry=30
+        )
+    )
+
+_transport = _new_transport()
+
+class PooledHTTPClient(httpx.Client):
+    def __init__(self, **kwargs):
+        super().__init__(transport=_transport, **kwargs)
+
+    # supabase-py sub-clients close their sessions through aclose(); the
+    # transport is shared, so one of them closing must not drop the pool
+    def aclose(self):
+        pass
+
+class PooledPostgrestClient(SyncPostgrestClient):
+    def create_session(self, base_url, headers, timeout):
+        return PooledHTTPClient(base_url=base_url, headers=headers, timeout=timeout)
+
+class PooledStorageClient(SupabaseStorageClient):
+    def _create_session(self, base_url, headers, timeout):
+        return PooledHTTPClient(base_url=base_url, headers=headers, timeout=timeout)
+
+class PooledClient(supabase.Client):
+    # supabase.Client rebuilds postgrest/storage after every auth event, so the
+    # pooled sessions are installed through its factories rather than patched in.
+    @staticmethod
+    def _init_postgrest_client(rest_url, headers, schema, timeout=5):
+        return PooledPostgrestClient(rest_url, headers=headers, schema=schema, timeout=timeout)
+
+    @staticmethod
+    def _init_storage_client(storage_url, headers, storage_client_timeout=20):
+        return PooledStorageClient(storage_url, headers, storage_client_timeout)
+
+    @staticmethod
+    def _init_supabase_auth_client(auth_url, client_options):
+        return SupabaseAuthClient(
+            url=auth_url,
+            auto_refresh_token=client_options.auto_refresh_token,
+            persist_session=client_options.persist_session,
+            storage=client_options.storage,
+            headers=client_options.headers,
+            flow_type=client_options.flow_type,
+            http_client=PooledHTTPClient(),
+        )
+
+# One client per process; handlers must not create their own
+@lru_cache(maxsize=1)
+def get_supabase_client():
+    return PooledClient(supabase_url, supabase_key)
+
+# Give this process its own pool. Called from gunicorn's post_fork so workers
+# never share sockets opened in the master (e.g. with preload_app).
+def reset_pool():
+    global _transport
+    _transport = _new_transport()
+
+    client = get_supabase_client()
+    client.auth._http_client = PooledHTTPClient()
+    # Recreated lazily on next use, picking up the new transport
+    client._postgrest = None
+    client._storage = None
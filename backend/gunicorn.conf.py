@@ -0,0 +1,36 @@
+# Gunicorn settings for the API, picked up automatically when running
+# `gunicorn main:app` from the backend directory.
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5000")
+
+# Every endpoint spends most of its time waiting on Supabase over HTTP, so
+# use threaded workers: a request blocked on the network only holds its own
+# thread instead of the whole worker process.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+timeout = 30
+
+# Import the app once in the master and fork workers from it; post_fork below
+# gives each worker its own connection pool.
+preload_app = True
+
+# Hold idle client connections briefly so the app's repeat calls reuse them,
+# and cap open connections per worker (gthread honours worker_connections).
+keepalive = 5
+worker_connections = 1000
+
+# Logs go to stdout/stderr for the process supervisor to collect, so the
+# request path never writes to disk. Access logging is off by default since
+# the reverse proxy already records requests; set GUNICORN_ACCESSLOG=- to
+# turn it on.
+accesslog = os.getenv("GUNICORN_ACCESSLOG")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Each worker builds its own Supabase connection pool, see db.py
+    import db
+    db.reset_pool()
@@ -0,0 +1,14 @@
+-- Profile for GET /api/profile/<id>, created with defaults on first access.
+-- One round trip and race-free, replacing select-then-insert in the API.
+-- An existing row is left untouched so reads don't fire the updated_at trigger.
+
+create or replace function get_or_create_profile(p_id uuid, p_email text)
+returns setof profiles
+language sql
+as $$
+    insert into profiles (id, email, username, full_name, avatar_url)
+    values (p_id, p_email, split_part(p_email, '@', 1), '', null)
+    on conflict (id) do nothing;
+
+    select * from profiles where id = p_id;
+$$;
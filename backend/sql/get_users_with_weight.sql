@@ -0,0 +1,38 @@
+-- Leaderboard for /api/users: every profile plus its weight for target_date.
+-- Only the columns the app displays are returned.
+-- Run in the Supabase SQL editor; the backend calls it via client.rpc().
+
+create index if not exists idx_weight_logs_date_user
+    on weight_logs (log_date, user_id);
+
+-- Signature changed when pagination was added; drop the old overload so
+-- PostgREST doesn't have two candidates to choose from.
+drop function if exists get_users_with_weight(date);
+
+create or replace function get_users_with_weight(
+    target_date date,
+    p_limit int default 100,
+    p_offset int default 0
+)
+returns setof jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'id', p.id,
+        'email', p.email,
+        'username', p.username,
+        'full_name', p.full_name,
+        'avatar_url', p.avatar_url
+    ) || case
+        when w.user_id is null then '{}'::jsonb
+        else jsonb_build_object('weight_logs', jsonb_build_array(
+            jsonb_build_object('weight', w.weight, 'log_date', w.log_date)
+        ))
+    end
+    from profiles p
+    left join weight_logs w
+        on w.user_id = p.id and w.log_date = target_date
+    order by p.username, p.id
+    limit p_limit offset p_offset;
+$$;
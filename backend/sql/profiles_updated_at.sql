@@ -0,0 +1,19 @@
+-- profiles.updated_at is maintained by the database; the API doesn't send it.
+-- Inserts get the column default, updates (including upsert conflicts) the trigger.
+
+alter table profiles alter column updated_at set default now();
+
+create or replace function set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists profiles_set_updated_at on profiles;
+create trigger profiles_set_updated_at
+    before update on profiles
+    for each row execute function set_updated_at();
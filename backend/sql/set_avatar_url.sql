@@ -0,0 +1,14 @@
+-- Avatar URL write for POST /api/profile/<id>/avatar. Creates the profile with
+-- the same defaults as get_or_create_profile when it doesn't exist yet, so an
+-- upload before the first profile fetch still saves the URL. Returns only the
+-- id: enough to confirm a row was written without sending the row back.
+
+create or replace function set_avatar_url(p_id uuid, p_email text, p_avatar_url text)
+returns setof uuid
+language sql
+as $$
+    insert into profiles (id, email, username, full_name, avatar_url)
+    values (p_id, p_email, split_part(p_email, '@', 1), '', p_avatar_url)
+    on conflict (id) do update set avatar_url = excluded.avatar_url
+    returning id;
+$$;